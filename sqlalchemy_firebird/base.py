@@ -3,6 +3,13 @@ from __future__ import annotations
 
 from packaging import version
 
+from collections import defaultdict
+import contextlib
+import functools
+import re
+import sys
+import threading
+
 from typing import List
 from typing import Optional
 
@@ -23,10 +30,27 @@ from sqlalchemy.sql import roles
 
 import sqlalchemy_firebird.types as fb_types
 
+from .fb_info40 import RESERVED_WORDS as LATEST_RESERVED_WORDS
+
 
 # Expression separator for COMPUTER BY expressions
 EXPRESSION_SEPARATOR = "||"
 
+# Maximum number of items in an IN (...) list (Firebird 4 and lower)
+MAX_IN_LIST_ITEMS = 1500
+
+# Maximum number of names memoized by FBDialect.normalize_name() and
+#   FBDialect.denormalize_name(), each
+NAME_CACHE_SIZE = 4096
+
+# Number of rows fetched per round-trip by multi-table reflection queries
+MULTI_REFLECTION_FETCH_SIZE = 1000
+
+# Reflected default values come down as "DEFAULT <value>": there may be more
+#   than one whitespace around the "DEFAULT" keyword and it may also be lower
+#   case (see also http://tracker.firebirdsql.org/browse/CORE-356)
+DEFAULT_SOURCE_RE = re.compile(r"\s*DEFAULT\s+(.*)", re.IGNORECASE | re.DOTALL)
+
 
 def coalesce(*arg):
     # https://stackoverflow.com/questions/4978738/is-there-a-python-equivalent-of-the-c-sharp-null-coalescing-operator#comment37717570_16247152
@@ -152,7 +176,9 @@ class FBCompiler(sql.compiler.SQLCompiler):
         return "CURRENT_TIMESTAMP"
 
     def function_argspec(self, fn, **kw):
-        if fn.clauses is not None and len(fn.clauses) > 0:
+        # ClauseList defines no boolean value: test its list of clauses.
+        clauses = fn.clauses
+        if clauses is not None and clauses.clauses:
             return self.process(fn.clause_expr, **kw)
 
         return ""
@@ -171,8 +197,9 @@ class FBCompiler(sql.compiler.SQLCompiler):
             return super().returning_clause(stmt, returning_cols, **kw)
 
         # For SQLAlchemy 1.4 compatibility only. Unneeded in 2.0.
+        label_returning_column = self._label_returning_column
         columns = [
-            self._label_returning_column(stmt, c)
+            label_returning_column(stmt, c)
             for c in expression._select_iterables(returning_cols)
         ]
 
@@ -181,11 +208,7 @@ class FBCompiler(sql.compiler.SQLCompiler):
 
 class FBDDLCompiler(sql.compiler.DDLCompiler):
     def get_column_specification(self, column, **kwargs):
-        colspec = self.preparer.format_column(column)
-
-        impl_type = column.type.dialect_impl(self.dialect)
-        if isinstance(impl_type, sa_types.TypeDecorator):
-            impl_type = impl_type.impl
+        colspec = [self.preparer.format_column(column)]
 
         has_identity = column.identity is not None
 
@@ -202,7 +225,7 @@ class FBDDLCompiler(sql.compiler.DDLCompiler):
             )
             and self.dialect.supports_identity_columns
         ):
-            colspec += " INTEGER GENERATED BY DEFAULT AS IDENTITY"
+            colspec.append("INTEGER GENERATED BY DEFAULT AS IDENTITY")
         else:
             type_compiler_instance = (
                 self.dialect.type_compiler_instance
@@ -210,26 +233,28 @@ class FBDDLCompiler(sql.compiler.DDLCompiler):
                 else self.dialect.type_compiler
             )
 
-            colspec += " " + type_compiler_instance.process(
-                column.type,
-                type_expression=column,
-                identifier_preparer=self.preparer,
+            colspec.append(
+                type_compiler_instance.process(
+                    column.type,
+                    type_expression=column,
+                    identifier_preparer=self.preparer,
+                )
             )
             default_ = self.get_column_default_string(column)
             if default_ is not None:
-                colspec += " DEFAULT " + default_
+                colspec.append("DEFAULT " + default_)
 
             if column.computed is not None:
-                colspec += " " + self.process(column.computed)
+                colspec.append(self.process(column.computed))
             if has_identity:
-                colspec += " " + self.process(column.identity)
+                colspec.append(self.process(column.identity))
 
             if not column.nullable and not has_identity:
-                colspec += " NOT NULL"
+                colspec.append("NOT NULL")
             elif column.nullable and has_identity:
-                colspec += " NULL"
+                colspec.append("NULL")
 
-        return colspec
+        return " ".join(colspec)
 
     def visit_create_index(
         self, create, include_schema=False, include_table_schema=True, **kw
@@ -367,6 +392,12 @@ class FBDDLCompiler(sql.compiler.DDLCompiler):
         return text
 
 
+# String types whose CHARACTER SET / COLLATE are implied by the type itself
+NO_CHARSET_STRING_TYPES = frozenset(
+    ["BINARY", "VARBINARY", "NCHAR", "NVARCHAR"]
+)
+
+
 class FBTypeCompiler(compiler.GenericTypeCompiler):
     def visit_boolean(self, type_, **kw):
         if self.dialect.server_version_info < (3,):
@@ -390,7 +421,7 @@ class FBTypeCompiler(compiler.GenericTypeCompiler):
         charset = getattr(type_, "charset", None)
         collation = getattr(type_, "collation", None)
 
-        if name in ["BINARY", "VARBINARY", "NCHAR", "NVARCHAR"]:
+        if name in NO_CHARSET_STRING_TYPES:
             charset = None
             collation = None
 
@@ -509,6 +540,11 @@ class FBTypeCompiler(compiler.GenericTypeCompiler):
 
 
 class FBIdentifierPreparer(sql.compiler.IdentifierPreparer):
+    # Until connected, quote the reserved words of the latest Firebird version.
+    #   FBDialect.initialize() replaces them, per instance, with the words of
+    #   the actual server version.
+    reserved_words = LATEST_RESERVED_WORDS
+
     illegal_initial_characters = compiler.ILLEGAL_INITIAL_CHARACTERS.union(
         ["_"]
     )
@@ -559,9 +595,365 @@ class FBInspector(reflection.Inspector):
             )
 
 
+def _reflect_string_type(colclass, row):
+    if row.character_set_name == fb_types.BINARY_CHARSET:
+        if colclass == fb_types.FBCHAR:
+            colclass = fb_types.FBBINARY
+        elif colclass == fb_types.FBVARCHAR:
+            colclass = fb_types.FBVARBINARY
+    if row.character_set_name == fb_types.NATIONAL_CHARSET:
+        if colclass == fb_types.FBCHAR:
+            colclass = fb_types.FBNCHAR
+        elif colclass == fb_types.FBVARCHAR:
+            colclass = fb_types.FBNVARCHAR
+
+    return colclass(
+        length=row.field_length,
+        charset=row.character_set_name,
+        collation=row.collation_name,
+    )
+
+
+def _reflect_numeric_type(colclass, row):
+    # FLOAT, DOUBLE PRECISION or DECFLOAT
+    return colclass(row.field_precision)
+
+
+def _reflect_integer_type(colclass, row):
+    # NUMERIC / DECIMAL types are stored as INTEGER types
+    if row.field_sub_type == 0:
+        # INTEGERs
+        return colclass()
+    elif row.field_sub_type == 1:
+        # NUMERIC
+        return fb_types.FBNUMERIC(
+            precision=row.field_precision, scale=row.field_scale
+        )
+    else:
+        # DECIMAL
+        return fb_types.FBDECIMAL(
+            precision=row.field_precision, scale=row.field_scale
+        )
+
+
+def _reflect_datetime_type(colclass, row):
+    has_timezone = "WITH TIME ZONE" in row.field_type
+    return colclass(timezone=has_timezone)
+
+
+def _reflect_large_binary_type(colclass, row):
+    if row.field_sub_type == 1:
+        return fb_types.FBTEXT(
+            row.segment_length,
+            row.character_set_name,
+            row.collation_name,
+        )
+
+    return fb_types.FBBLOB(row.segment_length)
+
+
+def _reflect_other_type(colclass, row):
+    return colclass()
+
+
+# Type reflectors for FBDialect.get_columns(), checked in order against the
+#   class found in FBDialect.ischema_names.
+_COLTYPE_REFLECTORS = (
+    (fb_types._FBString, _reflect_string_type),
+    (fb_types._FBNumeric, _reflect_numeric_type),
+    (fb_types._FBInteger, _reflect_integer_type),
+    (sa_types.DateTime, _reflect_datetime_type),
+    (fb_types._FBLargeBinary, _reflect_large_binary_type),
+)
+
+# Reflector already resolved for each ischema_names class
+_coltype_reflectors = {}
+
+
+def _get_coltype_reflector(colclass):
+    try:
+        return _coltype_reflectors[colclass]
+    except KeyError:
+        reflector = next(
+            (
+                reflector
+                for base, reflector in _COLTYPE_REFLECTORS
+                if issubclass(colclass, base)
+            ),
+            _reflect_other_type,
+        )
+        _coltype_reflectors[colclass] = reflector
+        return reflector
+
+
+_HAS_TABLE_QUERY = """
+    SELECT 1 AS has_table
+    FROM rdb$relations
+    WHERE rdb$relation_name = ?
+"""
+
+_HAS_SEQUENCE_QUERY = """
+    SELECT 1 AS has_sequence 
+    FROM rdb$generators
+    WHERE rdb$generator_name = ?
+"""
+
+_TABLE_NAMES_QUERY = """
+    SELECT TRIM(rdb$relation_name) AS relation_name
+    FROM rdb$relations
+    WHERE rdb$relation_type IN (0 /* TABLE */)
+      AND COALESCE(rdb$system_flag, 0) = 0
+    ORDER BY 1
+"""
+
+_TEMP_TABLE_NAMES_QUERY = """
+    SELECT TRIM(rdb$relation_name) AS relation_name
+    FROM rdb$relations
+    WHERE rdb$relation_type IN (4 /* TEMPORARY_TABLE_PRESERVE */, 
+                                5 /* TEMPORARY_TABLE_DELETE */)
+      AND COALESCE(rdb$system_flag, 0) = 0
+    ORDER BY 1
+"""
+
+_VIEW_NAMES_QUERY = """
+    SELECT TRIM(rdb$relation_name) AS relation_name
+    FROM rdb$relations
+    WHERE rdb$relation_type IN (1 /* VIEW */)
+      AND COALESCE(rdb$system_flag, 0) = 0
+    ORDER BY 1
+"""
+
+_SEQUENCE_NAMES_QUERY = """
+    SELECT TRIM(rdb$generator_name) AS generator_name
+    FROM rdb$generators
+    WHERE COALESCE(rdb$system_flag, 0) = 0
+"""
+
+_VIEW_DEFINITION_QUERY = """
+    SELECT rdb$view_source AS view_source
+    FROM rdb$relations
+    WHERE rdb$relation_type IN (1 /* VIEW */)
+      AND rdb$relation_name = ?
+"""
+
+_RELATION_NAMES_QUERY = """
+    SELECT TRIM(rdb$relation_name) AS relation_name
+    FROM rdb$relations
+"""
+
+_COLUMNS_QUERY = """
+    SELECT TRIM(rf.rdb$relation_name) AS relation_name,
+           TRIM(rf.rdb$field_name) AS field_name,
+           COALESCE(rf.rdb$null_flag, f.rdb$null_flag) AS null_flag,
+           TRIM(t.rdb$type_name) AS field_type,
+           f.rdb$field_length / COALESCE(cs.rdb$bytes_per_character, 1) AS field_length,
+           f.rdb$field_precision AS field_precision,
+           f.rdb$field_scale * -1 AS field_scale,
+           f.rdb$field_sub_type AS field_sub_type,
+           f.rdb$segment_length AS segment_length,
+           TRIM(cs.rdb$character_set_name) as character_set_name,
+           TRIM(cl.rdb$collation_name) as collation_name,
+           COALESCE(rf.rdb$default_source, f.rdb$default_source) AS default_source,
+           TRIM(rf.rdb$description) AS description,
+           f.rdb$computed_source AS computed_source
+          ,rf.rdb$identity_type AS identity_type,                      -- [fb3+]
+           g.rdb$initial_value AS initial_value,                       -- [fb3+]
+           g.rdb$generator_increment AS generator_increment            -- [fb3+]
+    FROM rdb$relation_fields rf
+         JOIN rdb$fields f
+           ON f.rdb$field_name = rf.rdb$field_source
+         JOIN rdb$types t
+           ON t.rdb$type = f.rdb$field_type 
+          AND t.rdb$field_name = 'RDB$FIELD_TYPE'
+         LEFT JOIN rdb$character_sets cs
+                ON cs.rdb$character_set_id = f.rdb$character_set_id
+         LEFT JOIN rdb$collations cl
+                ON cl.rdb$collation_id = rf.rdb$collation_id
+               AND cl.rdb$character_set_id = cs.rdb$character_set_id
+         LEFT JOIN rdb$generators g                                    -- [fb3+]
+                ON g.rdb$generator_name = rf.rdb$generator_name        -- [fb3+]
+    WHERE COALESCE(f.rdb$system_flag, 0) = 0
+      {relation_filter}
+    ORDER BY rf.rdb$relation_name, rf.rdb$field_position
+"""
+
+# Firebird 2.5 doesn't have RDB$GENERATOR_NAME nor RDB$IDENTITY_TYPE in
+# RDB$RELATION_FIELDS: remove query lines containing [fb3+]
+_COLUMNS_QUERY_FB25 = "\r\n".join(
+    line for line in _COLUMNS_QUERY.splitlines() if "[fb3+]" not in line
+)
+
+_PK_QUERY = """
+    SELECT TRIM(rc.rdb$relation_name) AS relation_name,
+           TRIM(rc.rdb$constraint_name) AS cname,
+           TRIM(se.rdb$field_name) AS fname
+    FROM rdb$relation_constraints rc
+         JOIN rdb$index_segments se
+           ON se.rdb$index_name = rc.rdb$index_name
+    WHERE rc.rdb$constraint_type = 'PRIMARY KEY'
+      {relation_filter}
+    ORDER BY rc.rdb$relation_name, se.rdb$field_position
+"""
+
+_FK_QUERY = """
+    SELECT TRIM(rc.rdb$relation_name) AS relation_name,
+           TRIM(rc.rdb$constraint_name) AS cname,
+           TRIM(cse.rdb$field_name) AS fname,
+           TRIM(ix2.rdb$relation_name) AS targetrname,
+           TRIM(se.rdb$field_name) AS targetfname,
+           TRIM(rfc.rdb$update_rule) AS update_rule,
+           TRIM(rfc.rdb$delete_rule) AS delete_rule
+    FROM rdb$relation_constraints rc
+         JOIN rdb$ref_constraints rfc 
+           ON rfc.rdb$constraint_name = rc.rdb$constraint_name
+         JOIN rdb$indices ix1 
+           ON ix1.rdb$index_name = rc.rdb$index_name
+         JOIN rdb$indices ix2 
+           ON ix2.rdb$index_name = ix1.rdb$foreign_key
+         JOIN rdb$index_segments cse 
+           ON cse.rdb$index_name = ix1.rdb$index_name
+         JOIN rdb$index_segments se 
+           ON se.rdb$index_name = ix2.rdb$index_name
+          AND se.rdb$field_position = cse.rdb$field_position
+    WHERE rc.rdb$constraint_type = 'FOREIGN KEY'
+      {relation_filter}
+    ORDER BY rc.rdb$relation_name, rc.rdb$constraint_name,
+             se.rdb$field_position
+"""
+
+_INDEXES_QUERY_TEMPLATE = """
+    SELECT TRIM(ix.rdb$relation_name) AS relation_name,
+           ix.rdb$index_name AS index_name,
+           ix.rdb$unique_flag AS unique_flag,
+           ix.rdb$index_type AS descending_flag,
+           ic.rdb$field_name AS field_name,
+           TRIM(ix.rdb$expression_source) expression_source,
+           {condition_source} condition_source
+    FROM rdb$indices ix
+        LEFT OUTER JOIN rdb$index_segments ic
+          ON ic.rdb$index_name = ix.rdb$index_name
+    WHERE ix.rdb$foreign_key IS NULL
+      AND NOT EXISTS (
+          SELECT 1
+          FROM rdb$relation_constraints rc
+          WHERE rc.rdb$index_name = ix.rdb$index_name
+            AND rc.rdb$constraint_type = 'PRIMARY KEY'
+      )
+      {{relation_filter}}
+    ORDER BY ix.rdb$relation_name, ix.rdb$index_name,
+             ic.rdb$field_position
+"""
+
+_INDEXES_QUERY = _INDEXES_QUERY_TEMPLATE.format(
+    condition_source="TRIM(SUBSTRING(ix.rdb$condition_source FROM 6 FOR CHAR_LENGTH(ix.rdb$condition_source) - 5))"
+)
+
+# Firebird 4 and lower doesn't have RDB$CONDITION_SOURCE (for partial indices)
+_INDEXES_QUERY_FB4 = _INDEXES_QUERY_TEMPLATE.format(
+    condition_source="CAST(NULL AS BLOB SUB_TYPE TEXT)"
+)
+
+_TABLE_INDEXES_TEXT = text(
+    _INDEXES_QUERY.format(
+        relation_filter="AND ix.rdb$relation_name = :relation_name"
+    )
+)
+
+_TABLE_INDEXES_TEXT_FB4 = text(
+    _INDEXES_QUERY_FB4.format(
+        relation_filter="AND ix.rdb$relation_name = :relation_name"
+    )
+)
+
+_FIELD_NAMES_QUERY = """
+    SELECT TRIM(r.rdb$relation_name) AS relation_name,
+           TRIM(r.rdb$field_name) AS fname
+    FROM rdb$relation_fields r
+    WHERE COALESCE(r.rdb$system_flag, 0) = 0
+      {relation_filter}
+"""
+
+_TABLE_COMMENT_QUERY = """
+    SELECT TRIM(rdb$description) AS comment
+    FROM rdb$relations
+    WHERE rdb$relation_name = ?
+"""
+
+_COMMENTED_RELATION_NAMES_QUERY = """
+    SELECT TRIM(rdb$relation_name) AS relation_name
+    FROM rdb$relations
+    WHERE rdb$description IS NOT NULL
+"""
+
+# Relations without a comment are left out
+_TABLE_COMMENTS_QUERY = """
+    SELECT TRIM(rdb$relation_name) AS relation_name,
+           TRIM(rdb$description) AS comment
+    FROM rdb$relations
+    WHERE rdb$description IS NOT NULL
+      {relation_filter}
+"""
+
+
+def _shared_info_cache(self, kw):
+    # The info_cache to use: the one shared by FBDialect.caching_schema()
+    #   while it is active. Only calls that already bring an info_cache (i.e.
+    #   from an Inspector) use it: e.g. the has_table() checks of
+    #   MetaData.create_all() must see the tables dropped just before.
+    info_cache = kw.get("info_cache")
+    if info_cache is not None:
+        shared = getattr(self._shared_reflection, "info_cache", None)
+        if shared is not None:
+            info_cache = kw["info_cache"] = shared
+    return info_cache
+
+
+def _cache(fn):
+    # Same as reflection.cache, but results go to the info_cache shared by
+    #   FBDialect.caching_schema() while it is active.
+    cached_fn = reflection.cache(fn)
+
+    @functools.wraps(fn)
+    def decorated(self, connection, *args, **kw):
+        _shared_info_cache(self, kw)
+        return cached_fn(self, connection, *args, **kw)
+
+    return decorated
+
+
+def _multi_cache(fn):
+    # Same as _cache, for the get_multi_*() methods: they return generators
+    #   and take filter_names as a list, so keep a list of the results under
+    #   a hashable key instead.
+    @functools.wraps(fn)
+    def decorated(self, connection, **kw):
+        info_cache = _shared_info_cache(self, kw)
+        if info_cache is None:
+            return fn(self, connection, **kw)
+
+        key = (
+            fn.__name__,
+            tuple(
+                (k, tuple(v) if k == "filter_names" and v is not None else v)
+                for k, v in kw.items()
+                if k not in ("info_cache", "unreflectable")
+            ),
+        )
+        ret = info_cache.get(key)
+        if ret is None:
+            ret = info_cache[key] = list(fn(self, connection, **kw))
+        return ret
+
+    return decorated
+
+
 class FBDialect(default.DefaultDialect):
     bind_typing = BindTyping.RENDER_CASTS
 
+    # Driver dialects must still declare it themselves
+    #   (see firebird.py / fdb.py).
+    supports_statement_cache = True
+
     supports_alter = True
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
@@ -658,6 +1050,20 @@ class FBDialect(default.DefaultDialect):
 
     using_sqlalchemy2 = version.parse(SQLALCHEMY_VERSION).major >= 2
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Bounded memos of normalize_name() / denormalize_name()
+        self._normalize_name_cached = functools.lru_cache(
+            maxsize=NAME_CACHE_SIZE
+        )(self._normalize_name_interned)
+        self._denormalize_name_cached = functools.lru_cache(
+            maxsize=NAME_CACHE_SIZE
+        )(super().denormalize_name)
+
+        # State of caching_schema(), per thread
+        self._shared_reflection = threading.local()
+
     def initialize(self, connection):
         super().initialize(connection)
 
@@ -675,156 +1081,193 @@ class FBDialect(default.DefaultDialect):
             from .fb_info40 import MAX_IDENTIFIER_LENGTH, RESERVED_WORDS
 
         self.max_identifier_length = MAX_IDENTIFIER_LENGTH
-        self.preparer.reserved_words = RESERVED_WORDS
-
-    @reflection.cache
-    def has_table(self, connection, table_name, schema=None, **kw):
-        has_table_query = """
-            SELECT 1 AS has_table
-            FROM rdb$relations
-            WHERE rdb$relation_name = ?
+        self.identifier_preparer.reserved_words = RESERVED_WORDS
+
+        # IdentifierPreparer.quote() memoizes its decision per identifier.
+        #   Drop entries computed against the generic reserved words (e.g. when
+        #   compiling before the first connect) so they are checked again.
+        self.identifier_preparer._strings.clear()
+
+        # Name normalization depends on the reserved words, too.
+        self._normalize_name_cached.cache_clear()
+        self._denormalize_name_cached.cache_clear()
+
+    @contextlib.contextmanager
+    def caching_schema(self):
+        """Share reflection results among all inspectors used in the block.
+
+        Every ``Inspector`` has its own cache, so reflecting tables one by one
+        (e.g. ``Table(..., autoload_with=engine)``) queries the same catalog
+        rows again for each table. Within this block, all inspectors used in
+        the current thread share a single cache instead. Schema changes made
+        inside the block are not seen by reflection; direct checks such as
+        those of ``MetaData.create_all()`` still query the database.
         """
+        previous = getattr(self._shared_reflection, "info_cache", None)
+        self._shared_reflection.info_cache = (
+            {} if previous is None else previous
+        )
+        try:
+            yield
+        finally:
+            self._shared_reflection.info_cache = previous
+
+    # Only plain strings are memoized: a quoted_name compares equal to the
+    #   same str but may normalize differently, depending on its quote flag.
+
+    def _normalize_name_interned(self, name):
+        # Reflected identifiers repeat across tables (column names, referred
+        #   tables): share one string object for each of them.
+        result = super().normalize_name(name)
+        return sys.intern(result) if type(result) is str else result
+
+    def normalize_name(self, name):
+        if type(name) is str:
+            return self._normalize_name_cached(name)
+        return super().normalize_name(name)
+
+    def denormalize_name(self, name):
+        if type(name) is str:
+            return self._denormalize_name_cached(name)
+        return super().denormalize_name(name)
+
+    @_cache
+    def has_table(self, connection, table_name, schema=None, **kw):
         tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(has_table_query, (tablename,))
+        if len(tablename) > self.max_identifier_length:
+            # Such an object can't exist: don't ask the server
+            return False
+
+        c = connection.exec_driver_sql(_HAS_TABLE_QUERY, (tablename,))
         return c.first() is not None
 
-    @reflection.cache
+    @_cache
     def has_sequence(self, connection, sequence_name, schema=None, **kw):
-        has_sequence_query = """
-            SELECT 1 AS has_sequence 
-            FROM rdb$generators
-            WHERE rdb$generator_name = ?
-        """
         sequencename = self.denormalize_name(sequence_name)
-        c = connection.exec_driver_sql(has_sequence_query, (sequencename,))
+        if len(sequencename) > self.max_identifier_length:
+            # Such an object can't exist: don't ask the server
+            return False
+
+        c = connection.exec_driver_sql(_HAS_SEQUENCE_QUERY, (sequencename,))
         return c.first() is not None
 
-    @reflection.cache
+    @_cache
     def get_table_names(self, connection, schema=None, **kw):
-        tables_query = """
-            SELECT TRIM(rdb$relation_name) AS relation_name
-            FROM rdb$relations
-            WHERE rdb$relation_type IN (0 /* TABLE */)
-              AND COALESCE(rdb$system_flag, 0) = 0
-            ORDER BY 1
-        """
-
         return [
             self.normalize_name(row.relation_name)
-            for row in connection.exec_driver_sql(tables_query)
+            for row in connection.exec_driver_sql(_TABLE_NAMES_QUERY)
         ]
 
-    @reflection.cache
+    @_cache
     def get_temp_table_names(self, connection, schema=None, **kw):
-        temp_tables_query = """
-            SELECT TRIM(rdb$relation_name) AS relation_name
-            FROM rdb$relations
-            WHERE rdb$relation_type IN (4 /* TEMPORARY_TABLE_PRESERVE */, 
-                                        5 /* TEMPORARY_TABLE_DELETE */)
-              AND COALESCE(rdb$system_flag, 0) = 0
-            ORDER BY 1
-        """
         return [
             self.normalize_name(row.relation_name)
-            for row in connection.exec_driver_sql(temp_tables_query)
+            for row in connection.exec_driver_sql(_TEMP_TABLE_NAMES_QUERY)
         ]
 
-    @reflection.cache
+    @_cache
     def get_view_names(self, connection, schema=None, **kw):
-        views_query = """
-            SELECT TRIM(rdb$relation_name) AS relation_name
-            FROM rdb$relations
-            WHERE rdb$relation_type IN (1 /* VIEW */)
-              AND COALESCE(rdb$system_flag, 0) = 0
-            ORDER BY 1
-        """
         return [
             self.normalize_name(row.relation_name)
-            for row in connection.exec_driver_sql(views_query)
+            for row in connection.exec_driver_sql(_VIEW_NAMES_QUERY)
         ]
 
-    @reflection.cache
+    @_cache
     def get_sequence_names(self, connection, schema=None, **kw):
-        sequences_query = """
-            SELECT TRIM(rdb$generator_name) AS generator_name
-            FROM rdb$generators
-            WHERE COALESCE(rdb$system_flag, 0) = 0
-        """
         # Do not need ORDER BY
         return [
             self.normalize_name(row.generator_name)
-            for row in connection.exec_driver_sql(sequences_query)
+            for row in connection.exec_driver_sql(_SEQUENCE_NAMES_QUERY)
         ]
 
-    @reflection.cache
+    @_cache
     def get_view_definition(self, connection, view_name, schema=None, **kw):
-        view_query = """
-            SELECT rdb$view_source AS view_source
-            FROM rdb$relations
-            WHERE rdb$relation_type IN (1 /* VIEW */)
-              AND rdb$relation_name = ?
-        """
         viewname = self.denormalize_name(view_name)
-        c = connection.exec_driver_sql(view_query, (viewname,))
+        c = connection.exec_driver_sql(_VIEW_DEFINITION_QUERY, (viewname,))
         row = c.fetchone()
         if row:
             return row.view_source
 
         raise exc.NoSuchTableError(view_name)
 
-    @reflection.cache
-    def get_columns(  # noqa: C901
-        self, connection, table_name, schema=None, **kw
+    @_cache
+    def _get_relation_names(self, connection, **kw):
+        return {
+            self.normalize_name(row.relation_name)
+            for row in connection.exec_driver_sql(_RELATION_NAMES_QUERY)
+        }
+
+    def _get_multi_rows(
+        self, connection, query, relation_column, filter_names, use_text=False
     ):
-        columns_query = """
-            SELECT TRIM(rf.rdb$field_name) AS field_name,
-                   COALESCE(rf.rdb$null_flag, f.rdb$null_flag) AS null_flag,
-                   TRIM(t.rdb$type_name) AS field_type,
-                   f.rdb$field_length / COALESCE(cs.rdb$bytes_per_character, 1) AS field_length,
-                   f.rdb$field_precision AS field_precision,
-                   f.rdb$field_scale * -1 AS field_scale,
-                   f.rdb$field_sub_type AS field_sub_type,
-                   f.rdb$segment_length AS segment_length,
-                   TRIM(cs.rdb$character_set_name) as character_set_name,
-                   TRIM(cl.rdb$collation_name) as collation_name,
-                   COALESCE(rf.rdb$default_source, f.rdb$default_source) AS default_source,
-                   TRIM(rf.rdb$description) AS description,
-                   f.rdb$computed_source AS computed_source
-                  ,rf.rdb$identity_type AS identity_type,                      -- [fb3+]
-                   g.rdb$initial_value AS initial_value,                       -- [fb3+]
-                   g.rdb$generator_increment AS generator_increment            -- [fb3+]
-            FROM rdb$relation_fields rf
-                 JOIN rdb$fields f
-                   ON f.rdb$field_name = rf.rdb$field_source
-                 JOIN rdb$types t
-                   ON t.rdb$type = f.rdb$field_type 
-                  AND t.rdb$field_name = 'RDB$FIELD_TYPE'
-                 LEFT JOIN rdb$character_sets cs
-                        ON cs.rdb$character_set_id = f.rdb$character_set_id
-                 LEFT JOIN rdb$collations cl
-                        ON cl.rdb$collation_id = rf.rdb$collation_id
-                       AND cl.rdb$character_set_id = cs.rdb$character_set_id
-                 LEFT JOIN rdb$generators g                                    -- [fb3+]
-                        ON g.rdb$generator_name = rf.rdb$generator_name        -- [fb3+]
-            WHERE COALESCE(f.rdb$system_flag, 0) = 0
-              AND rf.rdb$relation_name = ?
-            ORDER BY rf.rdb$field_position
+        """Run a reflection query for many relations in one round-trip.
+
+        ``query`` has a ``{relation_filter}`` placeholder which restricts
+        ``relation_column`` to ``filter_names``, when given. Returns the rows
+        grouped by (normalized) relation name.
+
+        With ``use_text``, the query runs as a ``text()`` construct instead of
+        through ``exec_driver_sql()``.
         """
+        relation_filter = ""
+        params = None
+        if filter_names and len(filter_names) <= MAX_IN_LIST_ITEMS:
+            names = [self.denormalize_name(n) for n in filter_names]
+            if use_text:
+                params = {
+                    "relation_name_%d" % i: name
+                    for i, name in enumerate(names)
+                }
+                placeholders = ", ".join(":" + key for key in params)
+            else:
+                params = tuple(names)
+                placeholders = ", ".join("?" * len(params))
+            relation_filter = "AND %s IN (%s)" % (
+                relation_column,
+                placeholders,
+            )
 
-        is_firebird_25 = self.server_version_info < (3,)
-        has_identity_columns = not is_firebird_25
-        if not has_identity_columns:
-            # Firebird 2.5 doesn't have RDB$GENERATOR_NAME nor RDB$IDENTITY_TYPE in RDB$RELATION_FIELDS
-            #   Remove query lines containing [fb3+]
-            lines = str.splitlines(columns_query)
-            filtered = filter(lambda x: "[fb3+]" not in x, lines)
-            columns_query = "\r\n".join(list(filtered))
+        query = query.format(relation_filter=relation_filter)
+        if use_text:
+            result = connection.execute(text(query), params or {})
+        else:
+            result = connection.exec_driver_sql(query, params)
 
-        tablename = self.denormalize_name(table_name)
-        c = list(connection.exec_driver_sql(columns_query, (tablename,)))
+        # No stream_results here: the dialect has no server-side cursors to
+        #   switch to, and Firebird cursors already fetch from the server in
+        #   batches. yield_per() makes SQLAlchemy fetch them in batches, too.
+        rows_by_relation = defaultdict(list)
+        for row in result.yield_per(MULTI_REFLECTION_FETCH_SIZE):
+            relation_name = self.normalize_name(row.relation_name)
+            rows_by_relation[relation_name].append(row)
+
+        return rows_by_relation
+
+    def _multi_reflect_rows(
+        self, connection, rows_by_relation, reflect_rows, default, **kw
+    ):
+        # Serve each table of get_multi_*() from the rows of a single query.
+        def reflect_table(connection, table_name, schema=None, **kw):
+            # Callers may also spell the name as stored (e.g. "SOME_TABLE")
+            relation_name = self.normalize_name(
+                self.denormalize_name(table_name)
+            )
+            rows = rows_by_relation.get(relation_name)
+            if rows:
+                return reflect_rows(rows)
+
+            if relation_name not in self._get_relation_names(connection, **kw):
+                raise exc.NoSuchTableError(table_name)
+
+            return default()
+
+        return self._default_multi_reflect(reflect_table, connection, **kw)
+
+    def _reflect_columns(self, rows):
+        has_identity_columns = self.server_version_info >= (3,)
 
         cols = []
-        for row in c:
+        for row in rows:
             orig_colname = row.field_name
             colname = self.normalize_name(orig_colname)
 
@@ -836,69 +1279,21 @@ class FBDialect(default.DefaultDialect):
                     % (row.field_type, colname)
                 )
                 coltype = sa_types.NULLTYPE
-            elif issubclass(colclass, fb_types._FBString):
-                if row.character_set_name == fb_types.BINARY_CHARSET:
-                    if colclass == fb_types.FBCHAR:
-                        colclass = fb_types.FBBINARY
-                    elif colclass == fb_types.FBVARCHAR:
-                        colclass = fb_types.FBVARBINARY
-                if row.character_set_name == fb_types.NATIONAL_CHARSET:
-                    if colclass == fb_types.FBCHAR:
-                        colclass = fb_types.FBNCHAR
-                    elif colclass == fb_types.FBVARCHAR:
-                        colclass = fb_types.FBNVARCHAR
-
-                coltype = colclass(
-                    length=row.field_length,
-                    charset=row.character_set_name,
-                    collation=row.collation_name,
-                )
-            elif issubclass(colclass, fb_types._FBNumeric):
-                # FLOAT, DOUBLE PRECISION or DECFLOAT
-                coltype = colclass(row.field_precision)
-            elif issubclass(colclass, fb_types._FBInteger):
-                # NUMERIC / DECIMAL types are stored as INTEGER types
-                if row.field_sub_type == 0:
-                    # INTEGERs
-                    coltype = colclass()
-                elif row.field_sub_type == 1:
-                    # NUMERIC
-                    coltype = fb_types.FBNUMERIC(
-                        precision=row.field_precision, scale=row.field_scale
-                    )
-                else:
-                    # DECIMAL
-                    coltype = fb_types.FBDECIMAL(
-                        precision=row.field_precision, scale=row.field_scale
-                    )
-            elif issubclass(colclass, sa_types.DateTime):
-                has_timezone = "WITH TIME ZONE" in row.field_type
-                coltype = colclass(timezone=has_timezone)
-            elif issubclass(colclass, fb_types._FBLargeBinary):
-                if row.field_sub_type == 1:
-                    coltype = fb_types.FBTEXT(
-                        row.segment_length,
-                        row.character_set_name,
-                        row.collation_name,
-                    )
-                else:
-                    coltype = fb_types.FBBLOB(row.segment_length)
             else:
-                coltype = colclass()
+                coltype = _get_coltype_reflector(colclass)(colclass, row)
 
             # Extract default value
             defvalue = None
             if row.default_source is not None:
-                # the value comes down as "DEFAULT 'value'": there may be
-                # more than one whitespace around the "DEFAULT" keyword
-                # and it may also be lower case
-                # (see also http://tracker.firebirdsql.org/browse/CORE-356)
-                defexpr = row.default_source.lstrip()
-                assert defexpr[:8].rstrip().upper() == "DEFAULT", (
-                    "Unrecognized default value: %s" % defexpr
-                )
-                defvalue = defexpr[8:].strip()
-                defvalue = defvalue if defvalue != "NULL" else None
+                match = DEFAULT_SOURCE_RE.match(row.default_source)
+                if match is None:
+                    util.warn(
+                        "Unrecognized default value '%s' in column '%s'."
+                        % (row.default_source, colname)
+                    )
+                else:
+                    defvalue = match.group(1).rstrip()
+                    defvalue = defvalue if defvalue != "NULL" else None
 
             col_d = {
                 "name": colname,
@@ -935,10 +1330,29 @@ class FBDialect(default.DefaultDialect):
 
             cols.append(col_d)
 
+        return cols
+
+    def _get_columns_query(self):
+        if self.server_version_info < (3,):
+            return _COLUMNS_QUERY_FB25
+        return _COLUMNS_QUERY
+
+    @_cache
+    def get_columns(self, connection, table_name, schema=None, **kw):
+        columns_query = self._get_columns_query().format(
+            relation_filter="AND rf.rdb$relation_name = ?"
+        )
+
+        tablename = self.denormalize_name(table_name)
+        rows = connection.exec_driver_sql(
+            columns_query, (tablename,)
+        ).fetchall()
+
+        cols = self._reflect_columns(rows)
         if cols:
             return cols
 
-        if not self.has_table(connection, table_name, schema):
+        if not self.has_table(connection, table_name, schema, **kw):
             raise exc.NoSuchTableError(table_name)
 
         return (
@@ -947,31 +1361,41 @@ class FBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
-    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        pk_query = """
-            SELECT TRIM(rc.rdb$constraint_name) AS cname, TRIM(se.rdb$field_name) AS fname
-            FROM rdb$relation_constraints rc
-                 JOIN rdb$index_segments se
-                   ON se.rdb$index_name = rc.rdb$index_name
-            WHERE rc.rdb$constraint_type = 'PRIMARY KEY'
-              AND rc.rdb$relation_name = ?
-            ORDER BY se.rdb$field_position
-        """
-        tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(pk_query, (tablename,))
+    @_multi_cache
+    def get_multi_columns(self, connection, **kw):
+        rows_by_relation = self._get_multi_rows(
+            connection,
+            self._get_columns_query(),
+            "rf.rdb$relation_name",
+            kw.get("filter_names"),
+        )
+        return self._multi_reflect_rows(
+            connection,
+            rows_by_relation,
+            self._reflect_columns,
+            reflection.ReflectionDefaults.columns,
+            **kw,
+        )
 
-        rows = c.fetchall()
-        pkfields = (
-            [self.normalize_name(r.fname) for r in rows] if rows else None
+    def _reflect_pk_constraint(self, rows):
+        return {
+            "constrained_columns": [
+                self.normalize_name(r.fname) for r in rows
+            ],
+            "name": self.normalize_name(rows[0].cname),
+        }
+
+    @_cache
+    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
+        pk_query = _PK_QUERY.format(
+            relation_filter="AND rc.rdb$relation_name = ?"
         )
-        if pkfields:
-            return {
-                "constrained_columns": pkfields,
-                "name": self.normalize_name(rows[0].cname) if rows else None,
-            }
+        tablename = self.denormalize_name(table_name)
+        rows = connection.exec_driver_sql(pk_query, (tablename,)).fetchall()
+        if rows:
+            return self._reflect_pk_constraint(rows)
 
-        if not self.has_table(connection, table_name, schema):
+        if not self.has_table(connection, table_name, schema, **kw):
             raise exc.NoSuchTableError(table_name)
 
         return (
@@ -980,63 +1404,78 @@ class FBDialect(default.DefaultDialect):
             else {"constrained_columns": [], "name": None}
         )
 
-    @reflection.cache
-    def get_foreign_keys(self, connection, table_name, schema=None, **kw):
-        fk_query = """
-            SELECT TRIM(rc.rdb$constraint_name) AS cname,
-                   TRIM(cse.rdb$field_name) AS fname,
-                   TRIM(ix2.rdb$relation_name) AS targetrname,
-                   TRIM(se.rdb$field_name) AS targetfname,
-                   TRIM(rfc.rdb$update_rule) AS update_rule,
-                   TRIM(rfc.rdb$delete_rule) AS delete_rule
-            FROM rdb$relation_constraints rc
-                 JOIN rdb$ref_constraints rfc 
-                   ON rfc.rdb$constraint_name = rc.rdb$constraint_name
-                 JOIN rdb$indices ix1 
-                   ON ix1.rdb$index_name = rc.rdb$index_name
-                 JOIN rdb$indices ix2 
-                   ON ix2.rdb$index_name = ix1.rdb$foreign_key
-                 JOIN rdb$index_segments cse 
-                   ON cse.rdb$index_name = ix1.rdb$index_name
-                 JOIN rdb$index_segments se 
-                   ON se.rdb$index_name = ix2.rdb$index_name
-                  AND se.rdb$field_position = cse.rdb$field_position
-            WHERE rc.rdb$constraint_type = 'FOREIGN KEY'
-              AND rc.rdb$relation_name = ?
-            ORDER BY rc.rdb$constraint_name, se.rdb$field_position
-        """
-        tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(fk_query, (tablename,))
+    @_multi_cache
+    def get_multi_pk_constraint(self, connection, **kw):
+        rows_by_relation = self._get_multi_rows(
+            connection,
+            _PK_QUERY,
+            "rc.rdb$relation_name",
+            kw.get("filter_names"),
+        )
+        return self._multi_reflect_rows(
+            connection,
+            rows_by_relation,
+            self._reflect_pk_constraint,
+            reflection.ReflectionDefaults.pk_constraint,
+            **kw,
+        )
 
-        fks = util.defaultdict(
-            lambda: {
-                "name": None,
-                "constrained_columns": [],
+    def _reflect_foreign_keys(self, rows):
+        normalize_name = self.normalize_name
+
+        # (constrained columns, referred table, referred columns, options)
+        #   by constraint name
+        fks = {}
+        for row in rows:
+            cname = normalize_name(row.cname)
+            fk = fks.get(cname)
+            if fk is None:
+                # The rules are the same on every row of the constraint
+                options = {}
+                if row.update_rule not in ["NO ACTION", "RESTRICT"]:
+                    options["onupdate"] = row.update_rule
+                if row.delete_rule not in ["NO ACTION", "RESTRICT"]:
+                    options["ondelete"] = row.delete_rule
+
+                fk = fks[cname] = (
+                    [],
+                    normalize_name(row.targetrname),
+                    [],
+                    options,
+                )
+            fk[0].append(normalize_name(row.fname))
+            fk[2].append(normalize_name(row.targetfname))
+
+        return [
+            {
+                "name": cname,
+                "constrained_columns": constrained_columns,
                 "referred_schema": None,
-                "referred_table": None,
-                "referred_columns": [],
-                "options": {},
+                "referred_table": referred_table,
+                "referred_columns": referred_columns,
+                "options": options,
             }
+            for cname, (
+                constrained_columns,
+                referred_table,
+                referred_columns,
+                options,
+            ) in fks.items()
+        ]
+
+    @_cache
+    def get_foreign_keys(self, connection, table_name, schema=None, **kw):
+        fk_query = _FK_QUERY.format(
+            relation_filter="AND rc.rdb$relation_name = ?"
         )
+        tablename = self.denormalize_name(table_name)
+        c = connection.exec_driver_sql(fk_query, (tablename,))
 
-        for row in c:
-            cname = self.normalize_name(row.cname)
-            fk = fks[cname]
-            if not fk["name"]:
-                fk["name"] = cname
-                fk["referred_table"] = self.normalize_name(row.targetrname)
-            fk["constrained_columns"].append(self.normalize_name(row.fname))
-            fk["referred_columns"].append(self.normalize_name(row.targetfname))
-            if row.update_rule not in ["NO ACTION", "RESTRICT"]:
-                fk["options"]["onupdate"] = row.update_rule
-            if row.delete_rule not in ["NO ACTION", "RESTRICT"]:
-                fk["options"]["ondelete"] = row.delete_rule
-
-        result = list(fks.values())
+        result = self._reflect_foreign_keys(c)
         if result:
             return result
 
-        if not self.has_table(connection, table_name, schema):
+        if not self.has_table(connection, table_name, schema, **kw):
             raise exc.NoSuchTableError(table_name)
 
         return (
@@ -1045,46 +1484,45 @@ class FBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
-    def get_indexes(self, connection, table_name, schema=None, **kw):
-        condition_source_expr = "TRIM(SUBSTRING(ix.rdb$condition_source FROM 6 FOR CHAR_LENGTH(ix.rdb$condition_source) - 5))"
-
-        if self.server_version_info < (5,):
-            # Firebird 4 and lower doesn't have RDB$CONDITION_SOURCE (for partial indices)
-            condition_source_expr = "CAST(NULL AS BLOB SUB_TYPE TEXT)"
-
-        indexes_query = f"""
-            SELECT TRIM(ix.rdb$index_name) AS index_name,
-                   ix.rdb$unique_flag AS unique_flag,
-                   ix.rdb$index_type AS descending_flag,
-                   TRIM(ic.rdb$field_name) AS field_name,
-                   TRIM(ix.rdb$expression_source) expression_source,
-                   {condition_source_expr} condition_source
-            FROM rdb$indices ix
-                LEFT OUTER JOIN rdb$index_segments ic
-                  ON ic.rdb$index_name = ix.rdb$index_name
-                LEFT OUTER JOIN rdb$relation_constraints rc
-                             ON rc.rdb$index_name = ic.rdb$index_name
-            WHERE ix.rdb$relation_name = :relation_name
-              AND ix.rdb$foreign_key IS NULL
-              AND COALESCE(rc.rdb$constraint_type, '') <> 'PRIMARY KEY'
-            ORDER BY ix.rdb$index_name, ic.rdb$field_position
-        """
-        tablename = self.denormalize_name(table_name)
-
-        # Do not use connection.exec_driver_sql() here.
-        #    During tests we need to commit CREATE INDEX before this query. See provision.py listener.
-        c = connection.execute(
-            text(indexes_query), {"relation_name": tablename}
+    @_multi_cache
+    def get_multi_foreign_keys(self, connection, **kw):
+        rows_by_relation = self._get_multi_rows(
+            connection,
+            _FK_QUERY,
+            "rc.rdb$relation_name",
+            kw.get("filter_names"),
+        )
+        return self._multi_reflect_rows(
+            connection,
+            rows_by_relation,
+            self._reflect_foreign_keys,
+            reflection.ReflectionDefaults.foreign_keys,
+            **kw,
         )
 
-        indexes = util.defaultdict(dict)
-        for row in c:
-            indexrec = indexes[row.index_name]
-            if "name" not in indexrec:
-                indexrec["name"] = self.normalize_name(row.index_name)
-                indexrec["column_names"] = []
-                indexrec["unique"] = bool(row.unique_flag)
+    def _get_field_names(self, connection, tablename):
+        fields_query = _FIELD_NAMES_QUERY.format(
+            relation_filter="AND r.rdb$relation_name = ?"
+        )
+        c = connection.exec_driver_sql(fields_query, (tablename,))
+        return {self.normalize_name(row.fname) for row in c}
+
+    def _reflect_indexes(self, rows, get_field_names):
+        normalize_name = self.normalize_name
+
+        # Index and field names come down blank-padded (CHAR): they are
+        #   stripped here rather than with TRIM() on every row by the server.
+        result = []
+        column_names_by_index = {}
+        for row in rows:
+            column_names = column_names_by_index.get(row.index_name)
+            if column_names is None:
+                column_names = column_names_by_index[row.index_name] = []
+                indexrec = {
+                    "name": normalize_name(row.index_name.rstrip()),
+                    "column_names": column_names,
+                    "unique": bool(row.unique_flag),
+                }
                 if row.expression_source is not None:
                     expr = row.expression_source[
                         1:-1
@@ -1094,39 +1532,46 @@ class FBDialect(default.DefaultDialect):
                     "firebird_descending": bool(row.descending_flag),
                     "firebird_where": row.condition_source,
                 }
+                result.append(indexrec)
 
-            indexrec["column_names"].append(
-                self.normalize_name(row.field_name)
-            )
-
-        def _get_column_set(tablename):
-            colqry = """
-                SELECT TRIM(r.rdb$field_name) AS fname
-                FROM rdb$relation_fields r
-                WHERE r.rdb$relation_name = ?
-            """
-            return {
-                self.normalize_name(row.fname)
-                for row in connection.exec_driver_sql(colqry, (tablename,))
-            }
+            field_name = row.field_name
+            if field_name is not None:  # None for expression indexes
+                field_name = normalize_name(field_name.rstrip())
+            column_names.append(field_name)
 
-        def _adjust_column_names_for_expressions(result, tablename):
+        if any("expressions" in i for i in result):
             # Identify which expression elements are columns
-            colset = _get_column_set(tablename)
+            colset = get_field_names(rows[0].relation_name)
             for i in result:
                 expr = i.get("expressions")
                 if expr is not None:
                     i["column_names"] = [
-                        x if self.normalize_name(x) in colset else None
+                        x if normalize_name(x) in colset else None
                         for x in expr
                     ]
-            return result
 
-        result = list(indexes.values())
+        return result
+
+    @_cache
+    def get_indexes(self, connection, table_name, schema=None, **kw):
+        indexes_text = (
+            _TABLE_INDEXES_TEXT
+            if self.server_version_info >= (5,)
+            else _TABLE_INDEXES_TEXT_FB4
+        )
+        tablename = self.denormalize_name(table_name)
+
+        # Do not use connection.exec_driver_sql() here.
+        #    During tests we need to commit CREATE INDEX before this query. See provision.py listener.
+        c = connection.execute(indexes_text, {"relation_name": tablename})
+
+        result = self._reflect_indexes(
+            c.fetchall(), functools.partial(self._get_field_names, connection)
+        )
         if result:
-            return _adjust_column_names_for_expressions(result, tablename)
+            return result
 
-        if not self.has_table(connection, table_name, schema):
+        if not self.has_table(connection, table_name, schema, **kw):
             raise exc.NoSuchTableError(table_name)
 
         return (
@@ -1135,7 +1580,52 @@ class FBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
+    @_multi_cache
+    def get_multi_indexes(self, connection, **kw):
+        indexes_query = (
+            _INDEXES_QUERY
+            if self.server_version_info >= (5,)
+            else _INDEXES_QUERY_FB4
+        )
+        rows_by_relation = self._get_multi_rows(
+            connection,
+            indexes_query,
+            "ix.rdb$relation_name",
+            kw.get("filter_names"),
+            use_text=True,  # See get_indexes()
+        )
+
+        # Fetch the column names of all relations with expression indexes at
+        #   once, instead of once per relation.
+        expression_relations = [
+            relation_name
+            for relation_name, rows in rows_by_relation.items()
+            if any(row.expression_source is not None for row in rows)
+        ]
+        field_rows_by_relation = (
+            self._get_multi_rows(
+                connection,
+                _FIELD_NAMES_QUERY,
+                "r.rdb$relation_name",
+                expression_relations,
+            )
+            if expression_relations
+            else {}
+        )
+
+        def get_field_names(tablename):
+            field_rows = field_rows_by_relation[self.normalize_name(tablename)]
+            return {self.normalize_name(row.fname) for row in field_rows}
+
+        return self._multi_reflect_rows(
+            connection,
+            rows_by_relation,
+            lambda rows: self._reflect_indexes(rows, get_field_names),
+            reflection.ReflectionDefaults.indexes,
+            **kw,
+        )
+
+    @_cache
     def get_unique_constraints(
         self, connection, table_name, schema=None, **kw
     ):
@@ -1155,7 +1645,7 @@ class FBDialect(default.DefaultDialect):
         tablename = self.denormalize_name(table_name)
         c = connection.exec_driver_sql(unique_constraints_query, (tablename,))
 
-        ucs = util.defaultdict(lambda: {"name": None, "column_names": []})
+        ucs = defaultdict(lambda: {"name": None, "column_names": []})
 
         for row in c:
             cname = self.normalize_name(row.cname)
@@ -1168,7 +1658,7 @@ class FBDialect(default.DefaultDialect):
         if result:
             return result
 
-        if not self.has_table(connection, table_name, schema):
+        if not self.has_table(connection, table_name, schema, **kw):
             raise exc.NoSuchTableError(table_name)
 
         return (
@@ -1177,15 +1667,34 @@ class FBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
+    @_cache
+    def _get_commented_relation_names(self, connection, **kw):
+        # Most relations have no comment: know which ones do from a single
+        #   query, instead of fetching a BLOB for every table.
+        return {
+            self.normalize_name(row.relation_name)
+            for row in connection.exec_driver_sql(
+                _COMMENTED_RELATION_NAMES_QUERY
+            )
+        }
+
+    @_cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
-        table_comment_query = """
-            SELECT TRIM(rdb$description) AS comment
-            FROM rdb$relations
-            WHERE rdb$relation_name = ?
-        """
         tablename = self.denormalize_name(table_name)
-        c = connection.exec_driver_sql(table_comment_query, (tablename,))
+
+        if kw.get("info_cache") is not None:
+            # The names of the commented relations can be reused from the
+            #   cache: only query the comment of tables which have one.
+            relation_name = self.normalize_name(tablename)
+            commented = self._get_commented_relation_names(connection, **kw)
+            if relation_name not in commented:
+                relations = self._get_relation_names(connection, **kw)
+                if relation_name not in relations:
+                    raise exc.NoSuchTableError(table_name)
+
+                return {"text": None}
+
+        c = connection.exec_driver_sql(_TABLE_COMMENT_QUERY, (tablename,))
 
         row = c.fetchone()
         if row:
@@ -1193,7 +1702,23 @@ class FBDialect(default.DefaultDialect):
 
         raise exc.NoSuchTableError(table_name)
 
-    @reflection.cache
+    @_multi_cache
+    def get_multi_table_comment(self, connection, **kw):
+        rows_by_relation = self._get_multi_rows(
+            connection,
+            _TABLE_COMMENTS_QUERY,
+            "rdb$relation_name",
+            kw.get("filter_names"),
+        )
+        return self._multi_reflect_rows(
+            connection,
+            rows_by_relation,
+            lambda rows: {"text": rows[0].comment},
+            reflection.ReflectionDefaults.table_comment,
+            **kw,
+        )
+
+    @_cache
     def get_check_constraints(self, connection, table_name, schema=None, **kw):
         check_constraints_query = """
             SELECT TRIM(rc.rdb$constraint_name) AS cname,
@@ -1211,7 +1736,7 @@ class FBDialect(default.DefaultDialect):
         tablename = self.denormalize_name(table_name)
         c = connection.exec_driver_sql(check_constraints_query, (tablename,))
 
-        ccs = util.defaultdict(
+        ccs = defaultdict(
             lambda: {
                 "name": None,
                 "sqltext": None,
@@ -1229,7 +1754,7 @@ class FBDialect(default.DefaultDialect):
         if result:
             return result
 
-        if not self.has_table(connection, table_name, schema):
+        if not self.has_table(connection, table_name, schema, **kw):
             raise exc.NoSuchTableError(table_name)
 
         return (
@@ -1238,7 +1763,7 @@ class FBDialect(default.DefaultDialect):
             else []
         )
 
-    @reflection.cache
+    @_cache
     def _load_domains(self, connection, schema=None, **kw):
         domains_query = """
             SELECT TRIM(f.rdb$field_name) AS fname,
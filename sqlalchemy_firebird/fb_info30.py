@@ -2,7 +2,7 @@
 
     Variables:
         MAX_IDENTIFIER_LENGTH -> int
-        RESERVED_WORDS -> set
+        RESERVED_WORDS -> frozenset
 
 .._Firebird 3.0:
     https://firebirdsql.org/file/documentation/html/en/refdocs/fblangref30/firebird-30-language-reference.html
@@ -17,201 +17,203 @@ import sqlalchemy.types as sa_types
 MAX_IDENTIFIER_LENGTH = 31
 
 # https://firebirdsql.org/file/documentation/html/en/refdocs/fblangref30/firebird-30-language-reference.html#fblangref30-appx03-reskeywords
-RESERVED_WORDS = {
-    "add",
-    "admin",
-    "all",
-    "alter",
-    "and",
-    "any",
-    "as",
-    "at",
-    "avg",
-    "begin",
-    "between",
-    "bigint",
-    "bit_length",
-    "blob",
-    "boolean",
-    "both",
-    "by",
-    "case",
-    "cast",
-    "char",
-    "character",
-    "character_length",
-    "char_length",
-    "check",
-    "close",
-    "collate",
-    "column",
-    "commit",
-    "connect",
-    "constraint",
-    "corr",
-    "count",
-    "covar_pop",
-    "covar_samp",
-    "create",
-    "cross",
-    "current",
-    "current_connection",
-    "current_date",
-    "current_role",
-    "current_time",
-    "current_timestamp",
-    "current_transaction",
-    "current_user",
-    "cursor",
-    "date",
-    "day",
-    "dec",
-    "decimal",
-    "declare",
-    "default",
-    "delete",
-    "deleting",
-    "deterministic",
-    "disconnect",
-    "distinct",
-    "double",
-    "drop",
-    "else",
-    "end",
-    "escape",
-    "execute",
-    "exists",
-    "external",
-    "extract",
-    "false",
-    "fetch",
-    "filter",
-    "float",
-    "for",
-    "foreign",
-    "from",
-    "full",
-    "function",
-    "gdscode",
-    "global",
-    "grant",
-    "group",
-    "having",
-    "hour",
-    "in",
-    "index",
-    "inner",
-    "insensitive",
-    "insert",
-    "inserting",
-    "int",
-    "integer",
-    "into",
-    "is",
-    "join",
-    "leading",
-    "left",
-    "like",
-    "long",
-    "lower",
-    "max",
-    "merge",
-    "min",
-    "minute",
-    "month",
-    "national",
-    "natural",
-    "nchar",
-    "no",
-    "not",
-    "null",
-    "numeric",
-    "octet_length",
-    "of",
-    "offset",
-    "on",
-    "only",
-    "open",
-    "or",
-    "order",
-    "outer",
-    "over",
-    "parameter",
-    "plan",
-    "position",
-    "post_event",
-    "precision",
-    "primary",
-    "procedure",
-    "rdb$db_key",
-    "rdb$record_version",
-    "real",
-    "record_version",
-    "recreate",
-    "recursive",
-    "references",
-    "regr_avgx",
-    "regr_avgy",
-    "regr_count",
-    "regr_intercept",
-    "regr_r2",
-    "regr_slope",
-    "regr_sxx",
-    "regr_sxy",
-    "regr_syy",
-    "release",
-    "return",
-    "returning_values",
-    "returns",
-    "revoke",
-    "right",
-    "rollback",
-    "row",
-    "rows",
-    "row_count",
-    "savepoint",
-    "scroll",
-    "second",
-    "select",
-    "sensitive",
-    "set",
-    "similar",
-    "smallint",
-    "some",
-    "sqlcode",
-    "sqlstate",
-    "start",
-    "stddev_pop",
-    "stddev_samp",
-    "sum",
-    "table",
-    "then",
-    "time",
-    "timestamp",
-    "to",
-    "trailing",
-    "trigger",
-    "trim",
-    "true",
-    "union",
-    "unique",
-    "unknown",
-    "update",
-    "updating",
-    "upper",
-    "user",
-    "using",
-    "value",
-    "values",
-    "varchar",
-    "variable",
-    "varying",
-    "var_pop",
-    "var_samp",
-    "view",
-    "when",
-    "where",
-    "while",
-    "with",
-    "year",
-}
+RESERVED_WORDS = frozenset(
+    {
+        "add",
+        "admin",
+        "all",
+        "alter",
+        "and",
+        "any",
+        "as",
+        "at",
+        "avg",
+        "begin",
+        "between",
+        "bigint",
+        "bit_length",
+        "blob",
+        "boolean",
+        "both",
+        "by",
+        "case",
+        "cast",
+        "char",
+        "character",
+        "character_length",
+        "char_length",
+        "check",
+        "close",
+        "collate",
+        "column",
+        "commit",
+        "connect",
+        "constraint",
+        "corr",
+        "count",
+        "covar_pop",
+        "covar_samp",
+        "create",
+        "cross",
+        "current",
+        "current_connection",
+        "current_date",
+        "current_role",
+        "current_time",
+        "current_timestamp",
+        "current_transaction",
+        "current_user",
+        "cursor",
+        "date",
+        "day",
+        "dec",
+        "decimal",
+        "declare",
+        "default",
+        "delete",
+        "deleting",
+        "deterministic",
+        "disconnect",
+        "distinct",
+        "double",
+        "drop",
+        "else",
+        "end",
+        "escape",
+        "execute",
+        "exists",
+        "external",
+        "extract",
+        "false",
+        "fetch",
+        "filter",
+        "float",
+        "for",
+        "foreign",
+        "from",
+        "full",
+        "function",
+        "gdscode",
+        "global",
+        "grant",
+        "group",
+        "having",
+        "hour",
+        "in",
+        "index",
+        "inner",
+        "insensitive",
+        "insert",
+        "inserting",
+        "int",
+        "integer",
+        "into",
+        "is",
+        "join",
+        "leading",
+        "left",
+        "like",
+        "long",
+        "lower",
+        "max",
+        "merge",
+        "min",
+        "minute",
+        "month",
+        "national",
+        "natural",
+        "nchar",
+        "no",
+        "not",
+        "null",
+        "numeric",
+        "octet_length",
+        "of",
+        "offset",
+        "on",
+        "only",
+        "open",
+        "or",
+        "order",
+        "outer",
+        "over",
+        "parameter",
+        "plan",
+        "position",
+        "post_event",
+        "precision",
+        "primary",
+        "procedure",
+        "rdb$db_key",
+        "rdb$record_version",
+        "real",
+        "record_version",
+        "recreate",
+        "recursive",
+        "references",
+        "regr_avgx",
+        "regr_avgy",
+        "regr_count",
+        "regr_intercept",
+        "regr_r2",
+        "regr_slope",
+        "regr_sxx",
+        "regr_sxy",
+        "regr_syy",
+        "release",
+        "return",
+        "returning_values",
+        "returns",
+        "revoke",
+        "right",
+        "rollback",
+        "row",
+        "rows",
+        "row_count",
+        "savepoint",
+        "scroll",
+        "second",
+        "select",
+        "sensitive",
+        "set",
+        "similar",
+        "smallint",
+        "some",
+        "sqlcode",
+        "sqlstate",
+        "start",
+        "stddev_pop",
+        "stddev_samp",
+        "sum",
+        "table",
+        "then",
+        "time",
+        "timestamp",
+        "to",
+        "trailing",
+        "trigger",
+        "trim",
+        "true",
+        "union",
+        "unique",
+        "unknown",
+        "update",
+        "updating",
+        "upper",
+        "user",
+        "using",
+        "value",
+        "values",
+        "varchar",
+        "variable",
+        "varying",
+        "var_pop",
+        "var_samp",
+        "view",
+        "when",
+        "where",
+        "while",
+        "with",
+        "year",
+    }
+)
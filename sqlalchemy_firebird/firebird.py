@@ -16,10 +16,6 @@ from math import modf
 from sqlalchemy import util
 from .base import FBDialect
 
-import firebird.driver
-from firebird.driver import driver_config
-from firebird.driver import get_timezone
-
 
 class FBDialect_firebird(FBDialect):
     name = "firebird.firebird"
@@ -29,10 +25,13 @@ class FBDialect_firebird(FBDialect):
     @classmethod
     def dbapi(cls):
         # For SQLAlchemy 1.4 compatibility only. Deprecated in 2.0.
-        return firebird.driver
+        return cls.import_dbapi()
 
     @classmethod
     def import_dbapi(cls):
+        # Imported on demand: firebird-driver loads the fbclient library.
+        import firebird.driver
+
         return firebird.driver
 
     @util.memoized_property
@@ -66,6 +65,8 @@ class FBDialect_firebird(FBDialect):
         dbapi_connection.terminate()
 
     def create_connect_args(self, url):
+        from firebird.driver import driver_config
+
         opts = url.translate_connect_args(username="user")
 
         qry = url.query
@@ -119,18 +120,23 @@ class FBDialect_firebird(FBDialect):
         minor, major = modf(dbapi_connection.info.engine_version)
         return (int(major), int(minor * 10))
 
+    @util.memoized_property
+    def _get_timezone(self):
+        from firebird.driver import get_timezone
+
+        return get_timezone
+
     def adapt_timezone(self, param):
         # Convert tzinfo for firebird-driver. Requires tzinfo.tzname() method implemented.
-        if isinstance(param, datetime) and param.tzinfo:
-            return param.replace(tzinfo=get_timezone(param.tzname()))
-        elif isinstance(param, time) and param.tzinfo:
-            return param.replace(tzinfo=get_timezone(param.tzname()))
+        if isinstance(param, (datetime, time)) and param.tzinfo:
+            return param.replace(tzinfo=self._get_timezone(param.tzname()))
         return param
 
     def do_execute(self, cursor, statement, parameters, context=None):
         # Firebird-driver needs special time zone handling.
         #   https://github.com/FirebirdSQL/python3-driver/issues/19#issuecomment-1523045743
-        adapted_parameters = [self.adapt_timezone(p) for p in parameters]
+        adapt_timezone = self.adapt_timezone
+        adapted_parameters = [adapt_timezone(p) for p in parameters]
         super().do_execute(cursor, statement, adapted_parameters, context)
 
 
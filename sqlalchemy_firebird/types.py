@@ -23,9 +23,6 @@ class _FBString(sqltypes.String):
 class FBCHAR(_FBString):
     __visit_name__ = "CHAR"
 
-    def __init__(self, length=None, charset=None, collation=None):
-        super().__init__(length, charset, collation)
-
 
 class FBBINARY(FBCHAR):
     __visit_name__ = "BINARY"
@@ -46,9 +43,6 @@ class FBNCHAR(FBCHAR):
 class FBVARCHAR(_FBString):
     __visit_name__ = "VARCHAR"
 
-    def __init__(self, length=None, charset=None, collation=None):
-        super().__init__(length, charset, collation)
-
 
 class FBVARBINARY(FBVARCHAR):
     __visit_name__ = "VARBINARY"
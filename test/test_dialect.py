@@ -6,6 +6,7 @@ from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import extract
 from sqlalchemy import func
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import literal
 from sqlalchemy import MetaData
@@ -204,6 +205,18 @@ class MiscBackendTest(
             r = connection.execute(t.insert())
             eq_(r.inserted_primary_key, (1,))
 
+    def test_reserved_words_quoted(self):
+        # "current_connection" is reserved by Firebird but not by SQLAlchemy
+        with testing.db.connect():
+            preparer = testing.db.dialect.identifier_preparer
+            eq_(preparer.quote("current_connection"), '"current_connection"')
+            eq_(preparer.quote("some_name"), "some_name")
+
+    def test_has_table_name_too_long(self, connection):
+        too_long = "t" * (connection.dialect.max_identifier_length + 1)
+        eq_(inspect(connection).has_table(too_long), False)
+        eq_(inspect(connection).has_sequence(too_long), False)
+
     def test_quoted_name_bindparam_ok(self):
         from sqlalchemy.sql.elements import quoted_name
 
@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy import BigInteger
 from sqlalchemy import Column
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import Identity
@@ -20,6 +21,7 @@ from sqlalchemy.schema import CreateIndex
 from sqlalchemy.sql.schema import CheckConstraint
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import AssertsExecutionResults
 from sqlalchemy.testing.assertions import ComparesIndexes
 from sqlalchemy.testing.assertions import eq_
@@ -754,6 +756,112 @@ class ReflectionTest(
             },
         )
 
+    def test_multi_reflection(self, metadata, connection):
+        Table(
+            "fbsql_parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20), index=True),
+            comment="parent table",
+        )
+        Table(
+            "fbsql_child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", ForeignKey("fbsql_parent.id")),
+        )
+        Table("fbsql_nopk", metadata, Column("a", Integer))
+        metadata.create_all(connection)
+
+        names = ["fbsql_parent", "fbsql_child", "fbsql_nopk"]
+        insp = inspect(connection)
+        multi_columns = insp.get_multi_columns(filter_names=names)
+        multi_pks = insp.get_multi_pk_constraint(filter_names=names)
+        multi_fks = insp.get_multi_foreign_keys(filter_names=names)
+        multi_indexes = insp.get_multi_indexes(filter_names=names)
+        multi_comments = insp.get_multi_table_comment(filter_names=names)
+
+        for name in names:
+            eq_(
+                [c["name"] for c in multi_columns[(None, name)]],
+                [c["name"] for c in insp.get_columns(name)],
+            )
+            eq_(multi_pks[(None, name)], insp.get_pk_constraint(name))
+            eq_(multi_fks[(None, name)], insp.get_foreign_keys(name))
+            eq_(multi_indexes[(None, name)], insp.get_indexes(name))
+            eq_(multi_comments[(None, name)], insp.get_table_comment(name))
+
+        # Tables named as stored in the database, and missing tables
+        parent = Table("FBSQL_PARENT", MetaData(), autoload_with=connection)
+        eq_([c.name for c in parent.columns], ["id", "name"])
+        eq_([c.name for c in parent.primary_key], ["id"])
+        eq_([i.name for i in parent.indexes], ["ix_fbsql_parent_name"])
+        eq_(parent.comment, "parent table")
+
+        child = Table("FBSQL_CHILD", MetaData(), autoload_with=connection)
+        eq_(
+            [fk.target_fullname for fk in child.foreign_keys],
+            ["fbsql_parent.id"],
+        )
+
+        assert_raises(
+            exc.NoSuchTableError,
+            Table,
+            "fbsql_nope",
+            MetaData(),
+            autoload_with=connection,
+        )
+
+    def test_caching_schema(self, metadata, connection):
+        Table("fbsql_cached", metadata, Column("id", Integer))
+        metadata.create_all(connection)
+
+        with connection.dialect.caching_schema():
+            columns = inspect(connection).get_columns("fbsql_cached")
+            is_(inspect(connection).get_columns("fbsql_cached"), columns)
+
+        is_true(inspect(connection).get_columns("fbsql_cached") is not columns)
+
+    def test_caching_schema_autoload(self, metadata, connection):
+        Table(
+            "fbsql_cached",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(20), index=True),
+        )
+        metadata.create_all(connection)
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with connection.dialect.caching_schema():
+            first = Table("fbsql_cached", MetaData(), autoload_with=connection)
+            statements.clear()
+            second = Table(
+                "fbsql_cached", MetaData(), autoload_with=connection
+            )
+
+        eq_(statements, [])
+        eq_([c.name for c in second.columns], [c.name for c in first.columns])
+        eq_([i.name for i in second.indexes], [i.name for i in first.indexes])
+
+    def test_caching_schema_create_all(self, metadata, connection):
+        Table("fbsql_cached", metadata, Column("id", Integer))
+        metadata.create_all(connection)
+
+        with connection.dialect.caching_schema():
+            is_true(inspect(connection).has_table("fbsql_cached"))
+
+            # The checkfirst queries of drop_all() / create_all() don't use
+            #   the shared cache
+            metadata.drop_all(connection)
+            metadata.create_all(connection)
+
+        is_true(inspect(connection).has_table("fbsql_cached"))
+
 
 class IdentityReflectionTest(fixtures.TablesTest):
     __backend__ = True